@@ -5,6 +5,8 @@ Author: Mira Mamdoh
 """
 
 from typing import List, Dict, Tuple
+from collections import Counter
+import operator
 
 
 class IntentClassifier:
@@ -28,9 +30,21 @@ class IntentClassifier:
         if len(predictions) == 0:
             return 0.0
         
-        correct = sum(1 for pred, true in zip(predictions, ground_truth) if pred == true)
+        # map/operator.eq compares every pair without a Python-level loop
+        correct = sum(map(operator.eq, predictions, ground_truth))
         return correct / len(predictions)
     
+    @staticmethod
+    def _count_pairs(predictions: List[str],
+                     ground_truth: List[str]) -> Counter:
+        """
+        Count (actual, predicted) label pairs in a single pass
+        
+        Shared by the confusion matrix and precision/recall metrics, which
+        then only visit the distinct pairs rather than every sample.
+        """
+        return Counter(zip(ground_truth, predictions))
+    
     @staticmethod
     def get_confusion_matrix(predictions: List[str], 
                            ground_truth: List[str]) -> Dict[str, Dict[str, int]]:
@@ -46,15 +60,31 @@ class IntentClassifier:
         """
         matrix = {}
         
-        for pred, true in zip(predictions, ground_truth):
-            if true not in matrix:
-                matrix[true] = {}
-            if pred not in matrix[true]:
-                matrix[true][pred] = 0
-            matrix[true][pred] += 1
+        # Count each (actual, predicted) pair once, then nest the totals
+        for (true, pred), count in IntentClassifier._count_pairs(predictions, ground_truth).items():
+            matrix.setdefault(true, {})[pred] = count
         
         return matrix
     
+    @staticmethod
+    def get_confusion_matrix_array(predictions: List[str],
+                                   ground_truth: List[str]) -> Tuple[List[str], List[List[int]]]:
+        """
+        Generate a dense confusion matrix over all observed intents
+        
+        Args:
+            predictions: List of predicted intents
+            ground_truth: List of actual intents
+            
+        Returns:
+            Tuple of (sorted labels, matrix) where matrix[i][j] counts
+            samples of labels[i] predicted as labels[j]
+        """
+        labels = sorted(set(ground_truth) | set(predictions))
+        counts = IntentClassifier._count_pairs(predictions, ground_truth)
+        matrix = [[counts[(true, pred)] for pred in labels] for true in labels]
+        return labels, matrix
+    
     @staticmethod
     def calculate_precision_recall(predictions: List[str],
                                   ground_truth: List[str],
@@ -70,12 +100,14 @@ class IntentClassifier:
         Returns:
             Tuple of (precision, recall)
         """
-        true_positive = sum(1 for pred, true in zip(predictions, ground_truth)
-                          if pred == intent and true == intent)
-        false_positive = sum(1 for pred, true in zip(predictions, ground_truth)
-                           if pred == intent and true != intent)
-        false_negative = sum(1 for pred, true in zip(predictions, ground_truth)
-                           if pred != intent and true == intent)
+        counts = IntentClassifier._count_pairs(predictions, ground_truth)
+        
+        # Derive the counters from the distinct pairs instead of every sample
+        true_positive = counts[(intent, intent)]
+        false_positive = sum(count for (true, pred), count in counts.items()
+                             if pred == intent and true != intent)
+        false_negative = sum(count for (true, pred), count in counts.items()
+                             if true == intent and pred != intent)
         
         precision = true_positive / (true_positive + false_positive) if (true_positive + false_positive) > 0 else 0.0
         recall = true_positive / (true_positive + false_negative) if (true_positive + false_negative) > 0 else 0.0
@@ -93,7 +125,4 @@ class IntentClassifier:
         Returns:
             Dict mapping intent to count
         """
-        distribution = {}
-        for intent in intents:
-            distribution[intent] = distribution.get(intent, 0) + 1
-        return distribution
\ No newline at end of file
+        return dict(Counter(intents))
\ No newline at end of file
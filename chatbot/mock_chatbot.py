@@ -4,44 +4,89 @@ Simulates a GenAI chatbot with intent recognition and context handling
 Author: Mira Mamdoh
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Deque, NamedTuple
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
 import re
 
 
+_INTENT_KEYWORDS = {
+    "greeting": ("hello", "hi", "hey", "good morning", "good evening"),
+    "goodbye": ("bye", "goodbye", "see you", "farewell"),
+    "thanks": ("thank you", "thanks", "appreciate"),
+    "help": ("help", "assist", "support"),
+    "booking": ("book", "schedule", "appointment", "meeting"),
+    "status": ("status", "update", "progress"),
+    "cancel": ("cancel", "stop", "abort"),
+    "question": ("what", "how", "why", "when", "where", "who"),
+    "name_query": ("my name", "what's my name", "who am i"),
+    "weather": ("weather", "forecast", "temperature", "rain")
+}
+
+_GREETING_PREFIXES = ("hi", "hello", "hey")
+_GOOD_TIMES = ("morning", "evening", "afternoon")
+_QUESTION_PREFIXES = ("what", "how", "why", "when", "where", "who")
+
+# Words that mark a message as a booking time while a booking is open
+_TIME_INDICATORS = frozenset({
+    "tomorrow", "today", "monday", "tuesday", "wednesday", "thursday", "friday",
+    "saturday", "sunday", "pm", "am", "morning", "afternoon", "evening", "at",
+    "1pm", "2pm", "3pm", "4pm", "5pm", "6pm", "7pm", "8pm", "9pm", "10pm", "11pm", "12pm",
+    "1am", "2am", "3am", "4am", "5am", "6am", "7am", "8am", "9am", "10am", "11am", "12am"
+})
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Clock times such as "2:30pm", "9.30 am" or "10am"
+_CLOCK_RE = re.compile(r"\d{1,2}(?:[:.]\d{2})?\s*(?:am|pm)\b")
+
+# Mock classifier confidence; any other intent scores 0.85
+_CONFIDENCE = {"unknown": 0.3, "greeting": 0.95, "goodbye": 0.95, "thanks": 0.95}
+
+# Name introduction patterns, tried in order so "my name is" wins over the others
+_NAME_PATTERNS = tuple(re.compile(phrase + r"\s+(\w+)", re.IGNORECASE)
+                       for phrase in ("my name is", "i am", "i'm", "call me"))
+
+
+class Turn(NamedTuple):
+    """A single message in the conversation history"""
+    role: str
+    content: str
+    intent: str
+
+
 class MockChatbot:
     """
     A mock chatbot that simulates GenAI conversation capabilities
     Supports: Intent recognition, Context tracking, Multi-turn conversations
     """
     
-    def __init__(self):
-        self.conversation_history: List[Dict[str, str]] = []
+    INTENTS = MappingProxyType(_INTENT_KEYWORDS)
+    
+    RESPONSES = MappingProxyType({
+        "greeting": "Hello! How can I help you today?",
+        "goodbye": "Goodbye! Have a great day!",
+        "thanks": "You're welcome! Happy to help!",
+        "help": "I can help you with bookings, questions, and general inquiries. What do you need?",
+        "booking": "I'd be happy to help you book. When would you like to schedule?",
+        "status": "Let me check the status for you.",
+        "cancel": "Your request has been cancelled.",
+        "question": "That's a great question. Let me help you with that.",
+        "weather": "The weather today is sunny with a high of 25°C.",
+        "unknown": "I'm not sure I understand. Could you rephrase that?"
+    })
+    
+    def __init__(self, max_history: Optional[int] = None):
+        """
+        Args:
+            max_history: Keep only the most recent N turns (unbounded if None)
+        """
+        # History is stored column-wise; the three deques stay index-aligned
+        self._roles: Deque[str] = deque(maxlen=max_history)
+        self._contents: Deque[str] = deque(maxlen=max_history)
+        self._intents: Deque[str] = deque(maxlen=max_history)
         self.context: Dict[str, any] = {}
-        self.intents = {
-            "greeting": ["hello", "hi", "hey", "good morning", "good evening"],
-            "goodbye": ["bye", "goodbye", "see you", "farewell"],
-            "thanks": ["thank you", "thanks", "appreciate"],
-            "help": ["help", "assist", "support"],
-            "booking": ["book", "schedule", "appointment", "meeting"],
-            "status": ["status", "update", "progress"],
-            "cancel": ["cancel", "stop", "abort"],
-            "question": ["what", "how", "why", "when", "where", "who"],
-            "name_query": ["my name", "what's my name", "who am i"],
-            "weather": ["weather", "forecast", "temperature", "rain"]
-        }
-        
-        self.responses = {
-            "greeting": "Hello! How can I help you today?",
-            "goodbye": "Goodbye! Have a great day!",
-            "thanks": "You're welcome! Happy to help!",
-            "help": "I can help you with bookings, questions, and general inquiries. What do you need?",
-            "booking": "I'd be happy to help you book. When would you like to schedule?",
-            "status": "Let me check the status for you.",
-            "cancel": "Your request has been cancelled.",
-            "question": "That's a great question. Let me help you with that.",
-            "weather": "The weather today is sunny with a high of 25°C.",
-            "unknown": "I'm not sure I understand. Could you rephrase that?"
-        }
     
     def get_intent(self, message: str) -> str:
         """
@@ -53,67 +98,70 @@ class MockChatbot:
         Returns:
             Intent classification string
         """
-        message_lower = message.lower().strip()
+        return self._classify(message.lower().strip())
+    
+    def get_intents(self, messages: List[str]) -> List[str]:
+        """
+        Classify a batch of user messages
         
+        Args:
+            messages: User input texts
+            
+        Returns:
+            Intent classification for each message, in order
+        """
+        classify = self._classify
+        return [classify(message.lower().strip()) for message in messages]
+    
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _classify(message_lower: str) -> str:
+        """
+        Classify an already lowercased and stripped message
+        
+        Classification depends only on the message text, so results are
+        memoized and repeated phrases cost a single cache lookup.
+        """
         # Check for name storage
-        if "my name is" in message_lower or ("i am" in message_lower and len(message_lower.split()) <= 3) or "i'm" in message_lower or "call me" in message_lower:
+        if ("my name is" in message_lower or "i'm" in message_lower or "call me" in message_lower
+                or ("i am" in message_lower and len(message_lower.split()) <= 3)):
             return "name_introduction"
         
         # Check for name query
-        if any(phrase in message_lower for phrase in self.intents["name_query"]):
+        if any(phrase in message_lower for phrase in _INTENT_KEYWORDS["name_query"]):
             return "name_query"
         
         # Priority order for overlapping keywords
         # 1. Thanks (check first before help because "thanks for your help")
-        if "thank" in message_lower or ("thanks" in message_lower and "help" not in message_lower.split("thanks")[0]) or "appreciate" in message_lower:
+        if "thank" in message_lower or "appreciate" in message_lower:
             return "thanks"
         
-        # 2. Help (specific when mentioned)
-        if ("help" in message_lower or "assist" in message_lower or "support" in message_lower) and "thank" not in message_lower:
-            return "help"
-        
-        # 3. Goodbye (check "good" in context)
-        if message_lower.startswith("good") and ("bye" in message_lower or message_lower == "goodbye"):
-            return "goodbye"
-        if any(word in message_lower for word in ["bye", "farewell", "see you"]):
-            return "goodbye"
-        
-        # 4. Weather (specific)
-        if any(keyword in message_lower for keyword in self.intents["weather"]):
-            return "weather"
-        
-        # 5. Booking
-        if any(keyword in message_lower for keyword in self.intents["booking"]):
-            return "booking"
+        # 2. Help, goodbye, weather and booking keywords anywhere in the message
+        for intent in ("help", "goodbye", "weather", "booking"):
+            if any(keyword in message_lower for keyword in _INTENT_KEYWORDS[intent]):
+                return intent
         
-        # 6. Greeting (check start of message)
-        if message_lower.startswith("hi") or message_lower.startswith("hello") or message_lower.startswith("hey"):
+        # 3. Greeting (check start of message)
+        if message_lower.startswith(_GREETING_PREFIXES):
             return "greeting"
-        if message_lower.startswith("good") and ("morning" in message_lower or "evening" in message_lower or "afternoon" in message_lower):
+        if message_lower.startswith("good") and any(time in message_lower for time in _GOOD_TIMES):
             return "greeting"
         
-        # 7. Question words at start
-        if any(message_lower.startswith(q) for q in ["what", "how", "why", "when", "where", "who"]):
+        # 4. Question words at start
+        if message_lower.startswith(_QUESTION_PREFIXES):
             return "question"
         
-        # 8. Other intents
-        for intent in ["status", "cancel"]:
-            if any(keyword in message_lower for keyword in self.intents[intent]):
+        # 5. Other intents
+        for intent in ("status", "cancel"):
+            if any(keyword in message_lower for keyword in _INTENT_KEYWORDS[intent]):
                 return intent
         
         return "unknown"
     
     def extract_name(self, message: str) -> Optional[str]:
         """Extract name from introduction message"""
-        patterns = [
-            r"my name is (\w+)",
-            r"i am (\w+)",
-            r"i'm (\w+)",
-            r"call me (\w+)"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, message.lower())
+        for pattern in _NAME_PATTERNS:
+            match = pattern.search(message)
             if match:
                 return match.group(1).capitalize()
         return None
@@ -128,29 +176,42 @@ class MockChatbot:
         Returns:
             Chatbot response string
         """
+        message_lower = message.lower()
+        return self._respond(message, message_lower, self._classify(message_lower.strip()))
+    
+    def generate_responses(self, messages: List[str]) -> List[str]:
+        """
+        Generate responses for a sequence of user messages
+        
+        Messages are lowercased and classified as a batch, then answered in
+        order so context (names, bookings) carries across the sequence
+        exactly as with repeated generate_response calls.
+        
+        Args:
+            messages: User input texts, in conversation order
+            
+        Returns:
+            Chatbot response for each message
+        """
+        lowered = [message.lower() for message in messages]
+        classify = self._classify
+        intents = [classify(message_lower.strip()) for message_lower in lowered]
+        return [self._respond(message, message_lower, intent)
+                for message, message_lower, intent in zip(messages, lowered, intents)]
+    
+    def _respond(self, message: str, message_lower: str, intent: str) -> str:
+        """Apply context to a classified message, record it and build the reply"""
         # Check if we're in booking mode and message looks like a time
-        in_booking_mode = self.context.get("booking_started", False)
-        time_indicators = ["tomorrow", "today", "monday", "tuesday", "wednesday", 
-                          "thursday", "friday", "saturday", "sunday", "pm", "am", 
-                          "morning", "afternoon", "evening", "at ", " at", "1pm", "2pm", 
-                          "3pm", "4pm", "5pm", "6pm", "7pm", "8pm", "9pm", "10pm", "11pm", "12pm",
-                          "1am", "2am", "3am", "4am", "5am", "6am", "7am", "8am", "9am", "10am", "11am", "12am"]
-        # Only treat as time if doesn't start with question words
-        is_question = any(message.lower().startswith(q) for q in ["what", "how", "why", "when", "where", "who"])
-        looks_like_time = in_booking_mode and any(word in message.lower() for word in time_indicators) and not is_question
-        
-        # If in booking mode and looks like time, treat as booking continuation
-        if looks_like_time:
-            intent = "booking_time"
-        else:
-            intent = self.get_intent(message)
+        if self.context.get("booking_started", False):
+            # Only treat as time if doesn't start with question words
+            is_question = message_lower.startswith(_QUESTION_PREFIXES)
+            # If in booking mode and looks like time, treat as booking continuation
+            if not is_question and (not _TIME_INDICATORS.isdisjoint(_TOKEN_RE.findall(message_lower))
+                                    or _CLOCK_RE.search(message_lower)):
+                intent = "booking_time"
         
         # Store message in history
-        self.conversation_history.append({
-            "role": "user",
-            "content": message,
-            "intent": intent
-        })
+        self._record("user", message, intent)
         
         # Handle name introduction
         if intent == "name_introduction":
@@ -188,20 +249,43 @@ class MockChatbot:
         
         # Default responses
         else:
-            response = self.responses.get(intent, self.responses["unknown"])
+            response = self.RESPONSES.get(intent, self.RESPONSES["unknown"])
         
         # Store response in history
-        self.conversation_history.append({
-            "role": "assistant",
-            "content": response,
-            "intent": intent
-        })
+        self._record("assistant", response, intent)
         
         return response
     
+    def _record(self, role: str, content: str, intent: str):
+        """Append one message to the history columns"""
+        self._roles.append(role)
+        self._contents.append(content)
+        self._intents.append(intent)
+    
     def get_conversation_history(self) -> List[Dict[str, str]]:
         """Get full conversation history"""
-        return self.conversation_history
+        return [{"role": role, "content": content, "intent": intent}
+                for role, content, intent in zip(self._roles, self._contents, self._intents)]
+    
+    def get_turns(self) -> List[Turn]:
+        """Get conversation history as Turn records"""
+        return list(map(Turn, self._roles, self._contents, self._intents))
+    
+    def get_history_columns(self) -> Dict[str, List[str]]:
+        """
+        Get conversation history as parallel columns
+        
+        Cheaper than get_conversation_history for analytics such as
+        counting intents, since no per-message dict is built.
+        
+        Returns:
+            Dict with "role", "content" and "intent" lists of equal length
+        """
+        return {
+            "role": list(self._roles),
+            "content": list(self._contents),
+            "intent": list(self._intents)
+        }
     
     def get_context(self) -> Dict[str, any]:
         """Get current conversation context"""
@@ -209,8 +293,25 @@ class MockChatbot:
     
     def reset(self):
         """Reset conversation history and context"""
-        self.conversation_history = []
-        self.context = {}
+        self._roles.clear()
+        self._contents.clear()
+        self._intents.clear()
+        self.context.clear()
+    
+    @classmethod
+    def acquire(cls) -> "MockChatbot":
+        """Take a clean chatbot from the shared pool, creating one if it is empty"""
+        try:
+            return _POOL.pop()
+        except IndexError:
+            return cls()
+    
+    def release(self):
+        """Reset this chatbot and return it to the shared pool; releasing twice is a no-op"""
+        if any(pooled is self for pooled in _POOL):
+            return
+        self.reset()
+        _POOL.append(self)
     
     def get_response_length(self, response: str) -> int:
         """Get word count of response"""
@@ -221,19 +322,31 @@ class MockChatbot:
         Mock confidence score for intent classification
         In real chatbot, this would come from ML model
         """
-        if intent == "unknown":
-            return 0.3
-        elif intent in ["greeting", "goodbye", "thanks"]:
-            return 0.95
-        else:
-            return 0.85
+        return _CONFIDENCE.get(intent, 0.85)
+
+
+# Idle chatbots kept for reuse by MockChatbot.acquire()
+_POOL: List[MockChatbot] = []
 
 
 class Conversation:
     """Helper class to manage multi-turn conversations"""
     
-    def __init__(self):
-        self.chatbot = MockChatbot()
+    def __init__(self, max_history: Optional[int] = None,
+                 chatbot: Optional[MockChatbot] = None):
+        self.chatbot = chatbot if chatbot is not None else MockChatbot(max_history)
+        self.last_response = ""
+    
+    @classmethod
+    def acquire(cls) -> "Conversation":
+        """Start a conversation backed by a pooled chatbot"""
+        return cls(chatbot=MockChatbot.acquire())
+    
+    def release(self):
+        """Return the underlying chatbot to the pool; the conversation must not be used afterwards"""
+        if self.chatbot is not None:
+            self.chatbot.release()
+            self.chatbot = None
         self.last_response = ""
     
     def send(self, message: str) -> str:
@@ -0,0 +1,21 @@
+"""
+Shared Test Fixtures
+Session-wide data shared across test suites
+Author: Mira Mamdoh
+"""
+
+import pytest
+import json
+from pathlib import Path
+
+
+_HERE = Path(__file__).resolve().parent
+_TEST_DATA = _HERE.parent / "data" / "test_conversations.json"
+
+
+@pytest.fixture(scope="session")
+def test_conversations():
+    """Parsed data/test_conversations.json, loaded once per session (None if missing)"""
+    if not _TEST_DATA.exists():
+        return None
+    return json.loads(_TEST_DATA.read_bytes())
@@ -7,7 +7,6 @@ Author: Mira Mamdoh
 import pytest
 import sys
 import os
-import json
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -16,111 +15,77 @@ from chatbot.mock_chatbot import MockChatbot
 from chatbot.intent_classifier import IntentClassifier
 
 
+# (message, expected intent) pairs covering every supported intent
+_INTENT_CASES = (
+    # Greetings
+    ("Hello", "greeting"),
+    ("Hi", "greeting"),
+    ("Hey", "greeting"),
+    ("Good morning", "greeting"),
+    ("Good evening", "greeting"),
+    # Goodbyes
+    ("Goodbye", "goodbye"),
+    ("Bye", "goodbye"),
+    ("See you", "goodbye"),
+    ("Farewell", "goodbye"),
+    # Thanks
+    ("Thank you", "thanks"),
+    ("Thanks", "thanks"),
+    ("Thanks a lot", "thanks"),
+    ("I appreciate it", "thanks"),
+    # Help requests
+    ("I need help", "help"),
+    ("Can you help me?", "help"),
+    ("I need assistance", "help"),
+    ("Support please", "help"),
+    # Booking requests
+    ("I want to book a meeting", "booking"),
+    ("Can I schedule an appointment?", "booking"),
+    ("Book a slot please", "booking"),
+    # Questions
+    ("What is AI?", "question"),
+    ("How does this work?", "question"),
+    ("Why is this happening?", "question"),
+    ("When can I start?", "question"),
+    ("Where is the location?", "question"),
+    # Weather queries
+    ("What's the weather?", "weather"),
+    ("Weather forecast please", "weather"),
+    ("Is it going to rain?", "weather"),
+    # Unrecognizable messages
+    ("asdfghjkl", "unknown"),
+    ("xyz123", "unknown"),
+    ("random gibberish", "unknown")
+)
+
+
 class TestIntentRecognition:
     """Test suite for intent classification"""
     
-    def setup_method(self):
-        """Setup for each test"""
-        self.chatbot = MockChatbot()
-        self.classifier = IntentClassifier()
-    
-    def test_greeting_intent(self):
-        """Test recognition of greeting messages"""
-        greetings = ["Hello", "Hi", "Hey", "Good morning", "Good evening"]
-        
-        for greeting in greetings:
-            intent = self.chatbot.get_intent(greeting)
-            assert intent == "greeting", f"Failed for: {greeting}"
-        
-        print("✅ Greeting Intent Test PASSED")
+    @classmethod
+    def setup_class(cls):
+        """Create the chatbot and classifier once for the whole suite"""
+        cls.chatbot = MockChatbot()
+        cls.classifier = IntentClassifier()
     
-    def test_goodbye_intent(self):
-        """Test recognition of goodbye messages"""
-        goodbyes = ["Goodbye", "Bye", "See you", "Farewell"]
-        
-        for goodbye in goodbyes:
-            intent = self.chatbot.get_intent(goodbye)
-            assert intent == "goodbye", f"Failed for: {goodbye}"
-        
-        print("✅ Goodbye Intent Test PASSED")
-    
-    def test_thanks_intent(self):
-        """Test recognition of thank you messages"""
-        thanks_msgs = ["Thank you", "Thanks", "Thanks a lot", "I appreciate it"]
-        
-        for msg in thanks_msgs:
-            intent = self.chatbot.get_intent(msg)
-            assert intent == "thanks", f"Failed for: {msg}"
-        
-        print("✅ Thanks Intent Test PASSED")
-    
-    def test_help_intent(self):
-        """Test recognition of help requests"""
-        help_msgs = ["I need help", "Can you help me?", "I need assistance", "Support please"]
-        
-        for msg in help_msgs:
-            intent = self.chatbot.get_intent(msg)
-            assert intent == "help", f"Failed for: {msg}"
-        
-        print("✅ Help Intent Test PASSED")
-    
-    def test_booking_intent(self):
-        """Test recognition of booking requests"""
-        booking_msgs = [
-            "I want to book a meeting",
-            "Can I schedule an appointment?",
-            "Book a slot please"
-        ]
-        
-        for msg in booking_msgs:
-            intent = self.chatbot.get_intent(msg)
-            assert intent == "booking", f"Failed for: {msg}"
-        
-        print("✅ Booking Intent Test PASSED")
-    
-    def test_question_intent(self):
-        """Test recognition of question patterns"""
-        questions = [
-            "What is AI?",
-            "How does this work?",
-            "Why is this happening?",
-            "When can I start?",
-            "Where is the location?"
-        ]
-        
-        for question in questions:
-            intent = self.chatbot.get_intent(question)
-            assert intent == "question", f"Failed for: {question}"
-        
-        print("✅ Question Intent Test PASSED")
+    def setup_method(self):
+        """Clear shared chatbot state before each test"""
+        self.chatbot.reset()
     
-    def test_weather_intent(self):
-        """Test recognition of weather queries"""
-        weather_msgs = [
-            "What's the weather?",
-            "Weather forecast please",
-            "Is it going to rain?"
-        ]
-        
-        for msg in weather_msgs:
-            intent = self.chatbot.get_intent(msg)
-            assert intent == "weather", f"Failed for: {msg}"
-        
-        print("✅ Weather Intent Test PASSED")
+    @pytest.mark.parametrize("message,expected_intent", _INTENT_CASES)
+    def test_intent_classification(self, message, expected_intent):
+        """Test recognition of each supported intent"""
+        intent = self.chatbot.get_intent(message)
+        assert intent == expected_intent, f"Failed for: {message}"
     
-    def test_unknown_intent(self):
-        """Test handling of unrecognizable messages"""
-        unknown_msgs = [
-            "asdfghjkl",
-            "xyz123",
-            "random gibberish"
-        ]
-        
-        for msg in unknown_msgs:
-            intent = self.chatbot.get_intent(msg)
-            assert intent == "unknown", f"Should be unknown for: {msg}"
-        
-        print("✅ Unknown Intent Test PASSED")
+    def test_batch_intents_match_single(self):
+        """Test that batch classification agrees with per-message classification"""
+        messages = ["Hello", "Thanks for your help", "Book a meeting", "  BYE  ", ""]
+        
+        intents = self.chatbot.get_intents(messages)
+        assert intents == [self.chatbot.get_intent(msg) for msg in messages]
+        assert intents[3] == "goodbye"
+        assert self.chatbot.get_intents([]) == []
     
     def test_intent_confidence_scores(self):
         """Test confidence scores for intent classification"""
@@ -139,8 +104,6 @@ class TestIntentRecognition:
         # Low confidence for unknown
         confidence = self.chatbot.calculate_confidence("unknown")
         assert confidence < 0.5, f"Too high confidence for unknown: {confidence}"
-        
-        print("✅ Intent Confidence Test PASSED")
     
     def test_case_insensitivity(self):
         """Test that intent recognition is case-insensitive"""
@@ -152,11 +115,9 @@ class TestIntentRecognition:
             ("thank you", "thanks")
         ]
         
-        for msg, expected_intent in messages:
-            intent = self.chatbot.get_intent(msg)
+        intents = self.chatbot.get_intents([msg for msg, _ in messages])
+        for (msg, expected_intent), intent in zip(messages, intents):
             assert intent == expected_intent, f"Case sensitivity issue for: {msg}"
-        
-        print("✅ Case Insensitivity Test PASSED")
     
     @pytest.mark.parametrize("message,expected_intent", [
         ("Hi there!", "greeting"),
@@ -170,32 +131,41 @@ class TestIntentRecognition:
         intent = self.chatbot.get_intent(message)
         assert intent == expected_intent
     
-    def test_intent_accuracy_metrics(self):
-        """Test overall intent classification accuracy"""
-        # Load test data
-        test_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'test_conversations.json')
+    def test_confusion_matrix_consistency(self):
+        """Test that nested and dense confusion matrices agree"""
+        samples = [
+            ("Hello", "greeting"),
+            ("Thanks for your help", "thanks"),
+            ("I need help", "help"),
+            ("asdfghjkl", "greeting")
+        ]
+        
+        predictions = self.chatbot.get_intents([text for text, _ in samples])
+        ground_truth = [intent for _, intent in samples]
+        
+        nested = self.classifier.get_confusion_matrix(predictions, ground_truth)
+        labels, matrix = self.classifier.get_confusion_matrix_array(predictions, ground_truth)
         
-        if os.path.exists(test_file):
-            with open(test_file, 'r') as f:
-                data = json.load(f)
-            
-            predictions = []
-            ground_truth = []
-            
-            for sample in data.get('intent_test_samples', []):
-                predicted_intent = self.chatbot.get_intent(sample['text'])
-                predictions.append(predicted_intent)
-                ground_truth.append(sample['intent'])
-            
-            # Calculate accuracy
-            accuracy = self.classifier.calculate_accuracy(predictions, ground_truth)
-            
-            # Expect >80% accuracy
-            assert accuracy >= 0.8, f"Intent accuracy too low: {accuracy:.2%}"
-            
-            print(f"✅ Intent Accuracy Test PASSED: {accuracy:.2%}")
-        else:
+        assert labels == ["greeting", "help", "thanks", "unknown"]
+        for i, true in enumerate(labels):
+            for j, pred in enumerate(labels):
+                assert matrix[i][j] == nested.get(true, {}).get(pred, 0)
+        assert nested["greeting"] == {"greeting": 1, "unknown": 1}
+    
+    def test_intent_accuracy_metrics(self, test_conversations):
+        """Test overall intent classification accuracy"""
+        if test_conversations is None:
             pytest.skip("Test data file not found")
+        
+        samples = test_conversations.get('intent_test_samples', [])
+        predictions = self.chatbot.get_intents([sample['text'] for sample in samples])
+        ground_truth = [sample['intent'] for sample in samples]
+        
+        # Calculate accuracy
+        accuracy = self.classifier.calculate_accuracy(predictions, ground_truth)
+        
+        # Expect >80% accuracy
+        assert accuracy >= 0.8, f"Intent accuracy too low: {accuracy:.2%}"
 
 
 if __name__ == "__main__":